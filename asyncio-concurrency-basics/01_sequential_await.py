@@ -1,25 +1,55 @@
-import asyncio, time
+import asyncio
+from asyncio import sleep
+from time import perf_counter
+
+from utils.loop import run
+
+def describe(result):
+    """Formats a (name, elapsed) result; done only where it's printed"""
+    name, elapsed = result
+    return f"{name}: finished (total {elapsed:.2f}s)"
 
 async def first():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("first: starting; waiting 5s")
-    await asyncio.sleep(5)
-    return f"first: finished (total {time.perf_counter()-t0:.2f}s)"
+    await sleep(5)
+    return ("first", perf_counter()-t0)
 
 async def second():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("second: starting; waiting 2s")
-    await asyncio.sleep(2)
-    return f"second: finished (total {time.perf_counter()-t0:.2f}s)"
+    await sleep(2)
+    return ("second", perf_counter()-t0)
 
 async def main():
+    """Illustrative anti-pattern: independent coroutines awaited one after the other"""
     print("Running sequentially with await...")
     # Running tasks sequentially
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     r1 = await first()      # runs fully, then...
     r2 = await second()     # ...this runs
-    print(r1); print(r2)
-    print(f"total elapsed: {time.perf_counter()-t0:.2f}s")  # ~7s
+    print(describe(r1)); print(describe(r2))
+    elapsed = perf_counter()-t0
+    print(f"total elapsed: {elapsed:.2f}s")  # ~7s
+    return elapsed
+
+async def main_fast():
+    """The fix: run the independent coroutines concurrently (see 02_taskgroup_concurrent.py)"""
+    print("\nRunning concurrently with TaskGroup...")
+    t0 = perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        t1 = tg.create_task(first())
+        t2 = tg.create_task(second())
+    print(describe(t1.result())); print(describe(t2.result()))
+    elapsed = perf_counter()-t0
+    print(f"total elapsed: {elapsed:.2f}s")  # ~5s
+    return elapsed
+
+async def compare():
+    # Measure the cost of the sequential ladder against the concurrent version
+    slow = await main()
+    fast = await main_fast()
+    print(f"\nsequential - concurrent: {slow-fast:.2f}s saved")  # ~2s
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(compare())
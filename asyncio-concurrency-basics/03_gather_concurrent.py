@@ -1,24 +1,38 @@
-import asyncio, time
+import asyncio
+from asyncio import sleep
+from time import perf_counter
+
+from utils.loop import run
+
+def describe(result):
+    """Formats a (name, elapsed) result; done only where it's printed"""
+    name, elapsed = result
+    return f"{name}: finished (total {elapsed:.2f}s)"
 
 async def first():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("first: starting; waiting 5s")
-    await asyncio.sleep(5)
-    return f"first: finished (total {time.perf_counter()-t0:.2f}s)"
+    await sleep(5)
+    return ("first", perf_counter()-t0)
 
 async def second():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("second: starting; waiting 2s")
-    await asyncio.sleep(2)
-    return f"second: finished (total {time.perf_counter()-t0:.2f}s)"
+    await sleep(2)
+    return ("second", perf_counter()-t0)
 
 async def main():
-    print("Running with asyncio.gather...")
-    # Using asyncio.gather to run tasks concurrently
-    t0 = time.perf_counter()
-    r1, r2 = await asyncio.gather(first(), second())
-    print(r1); print(r2)
-    print(f"total elapsed: {time.perf_counter()-t0:.2f}s")  # ~5s
+    print("Running a former asyncio.gather call site with TaskGroup...")
+    # Was: r1, r2 = await asyncio.gather(first(), second())
+    # gather() does not cancel the sibling if one coroutine raises, so it keeps
+    # running as a "zombie" task; TaskGroup cancels it and raises an ExceptionGroup.
+    t0 = perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        t1 = tg.create_task(first())
+        t2 = tg.create_task(second())
+    r1, r2 = t1.result(), t2.result()
+    print(describe(r1)); print(describe(r2))
+    print(f"total elapsed: {perf_counter()-t0:.2f}s")  # ~5s
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,5 +1,7 @@
 import asyncio
 
+from utils.loop import run
+
 async def worker(name: str, delay: float, fail: bool = False):
     print(f"{name}: start (delay={delay}s, fail={fail})")
     try:
@@ -52,13 +54,17 @@ async def run_gather_return_exceptions():
             print(f"result {i}: {r}")
 
 async def run_gather_return_exceptions_with_cancel():
-    print("\n=== gather(return_exceptions=True) + manual cancel ===")
+    print("\n=== gather(return_exceptions=True) + cancel via asyncio.timeout ===")
     t1 = asyncio.create_task(worker("ok", 3.0, fail=False))
     t2 = asyncio.create_task(worker("to_cancel", 5.0, fail=False))
 
-    # Let them start, then cancel one explicitly
-    await asyncio.sleep(1.0)
-    t2.cancel()
+    # Give t2 1s (replaces sleep + t2.cancel()): on expiry the timeout cancels
+    # the pending `await t2`, which cancels t2 itself
+    try:
+        async with asyncio.timeout(1.0):
+            await t2
+    except TimeoutError:
+        print("to_cancel: timed out after 1.0s")
 
     results = await asyncio.gather(t1, t2, return_exceptions=True)
     for i, r in enumerate(results, start=1):
@@ -76,4 +82,4 @@ async def main():
     await run_gather_return_exceptions_with_cancel()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
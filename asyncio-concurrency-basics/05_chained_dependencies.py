@@ -1,54 +1,73 @@
-import asyncio, time
+import asyncio
+from asyncio import sleep
+from time import perf_counter
+
+from utils.loop import run
+
+def describe(result):
+    """Formats a (name, elapsed) result; done only where it's printed"""
+    name, elapsed = result
+    return f"{name}: finished (total {elapsed:.2f}s)"
 
 async def first():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("first: starting; waiting 5s")
-    await asyncio.sleep(5)
-    result = f"first: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"first returning: {result}")
+    await sleep(5)
+    result = ("first", perf_counter()-t0)
+    print(f"first returning: {describe(result)}")
     return result
 
 async def second():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("second: starting; waiting 2s")
-    await asyncio.sleep(2)
-    result = f"second: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"second returning: {result}")
+    await sleep(2)
+    result = ("second", perf_counter()-t0)
+    print(f"second returning: {describe(result)}")
     return result
 
 async def third(second_result):
-    t0 = time.perf_counter()
-    print(f"third: starting with input '{second_result}'; waiting 3s")
-    await asyncio.sleep(3)
-    result = f"third: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"third returning: {result}")
+    t0 = perf_counter()
+    print(f"third: starting with input '{describe(second_result)}'; waiting 3s")
+    await sleep(3)
+    result = ("third", perf_counter()-t0)
+    print(f"third returning: {describe(result)}")
     return result
 
+async def _await_then_third(task):
+    """Awaits the task (not its .result()), so third() starts as soon as it's done"""
+    return await third(await task)
+
 async def main_taskgroup():
     print("\nRunning with TaskGroup...")
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     async with asyncio.TaskGroup() as tg:
         t1 = tg.create_task(first())
         t2 = tg.create_task(second())
-    # At this point both first() and second() are complete
-    t3 = await third(t2.result())
+        # third() is chained on t2 inside the group instead of after it, so it
+        # doesn't wait for first() (~5s total instead of ~8s)
+        t3 = tg.create_task(_await_then_third(t2))
     print(f"Results:")
-    print(f"Task 1: {t1.result()}")
-    print(f"Task 2: {t2.result()}")
-    print(f"Task 3: {t3}")
-    print(f"total elapsed: {time.perf_counter()-t0:.2f}s")
+    print(f"Task 1: {describe(t1.result())}")
+    print(f"Task 2: {describe(t2.result())}")
+    print(f"Task 3: {describe(t3.result())}")
+    print(f"total elapsed: {perf_counter()-t0:.2f}s")
 
 async def main_gather():
-    print("\nRunning with gather...")
-    t0 = time.perf_counter()
-    r1, r2 = await asyncio.gather(first(), second())
+    print("\nRunning with gather (ported to TaskGroup)...")
+    t0 = perf_counter()
+    # Was: r1, r2 = await asyncio.gather(first(), second())
+    # TaskGroup keeps the same barrier but cancels the sibling if one fails
+    async with asyncio.TaskGroup() as tg:
+        t1 = tg.create_task(first())
+        t2 = tg.create_task(second())
+    r1, r2 = t1.result(), t2.result()
     # At this point both first() and second() are complete
     r3 = await third(r2)
     print(f"Results:")
-    print(f"Task 1: {r1}")
-    print(f"Task 2: {r2}")
-    print(f"Task 3: {r3}")
-    print(f"total elapsed: {time.perf_counter()-t0:.2f}s")
+    print(f"Task 1: {describe(r1)}")
+    print(f"Task 2: {describe(r2)}")
+    print(f"Task 3: {describe(r3)}")
+    print(f"total elapsed: {perf_counter()-t0:.2f}s")
 
 async def main():
     # Run both approaches to compare
@@ -56,4 +75,4 @@ async def main():
     await main_gather()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,12 +1,16 @@
 """
 This example demonstrates how to use asyncio.Queue to optimize task dependencies.
 
-Key improvements over 05_chained_dependencies.py:
+Compared with main_gather() in 05_chained_dependencies.py:
 1. Reduced total execution time from ~8s to ~5s
 2. third() starts immediately after second() completes (~2s mark)
 3. No need to wait for first() to finish before starting third()
 4. More flexible dependency management using queue-based communication
 
+05's main_taskgroup() reaches the same ~5s by chaining third() on second()'s task
+inside the TaskGroup. The queue decouples producer and consumer instead, which
+scales to a stream of results and to several producers and consumers.
+
 The queue approach allows tasks to start processing as soon as their dependencies
 are available, rather than waiting for all concurrent tasks to complete. This is
 particularly useful in scenarios where:
@@ -15,7 +19,7 @@ particularly useful in scenarios where:
 - You have a mix of fast and slow tasks, and don't want the slow tasks to block
   the processing of fast task results
 
-Without a queue (05_chained_dependencies.py):
+With a barrier (main_gather() in 05_chained_dependencies.py):
 - first() takes 5s
 - second() takes 2s
 - third() waits for both to finish (5s) before starting its 3s work
@@ -26,49 +30,92 @@ With a queue (this example):
 - second() takes 2s and immediately queues its result
 - third() starts at ~2s mark when second()'s result is available
 - Total time: ~5s (tasks overlap efficiently)
+
+The queue is bounded (QUEUE_MAXSIZE) and the consumer loops until a sentinel,
+so the same code keeps memory capped and streams item by item if second() is
+generalised to produce many results. main_queue_pool() takes that step: several
+second() producers feed a pool of third() workers through one shared queue, still
+in ~5s, because the workers process results in parallel.
 """
 
-import asyncio, time
+import asyncio
+from asyncio import sleep
+from time import perf_counter
+
+from utils.loop import run
+
+def describe(result):
+    """Formats a (name, elapsed) result; done only where it's printed"""
+    name, elapsed = result
+    return f"{name}: finished (total {elapsed:.2f}s)"
 
 async def first():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("first: starting; waiting 5s")
-    await asyncio.sleep(5)
-    result = f"first: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"first returning: {result}")
+    await sleep(5)
+    result = ("first", perf_counter()-t0)
+    print(f"first returning: {describe(result)}")
     return result
 
 async def second():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("second: starting; waiting 2s")
-    await asyncio.sleep(2)
-    result = f"second: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"second returning: {result}")
+    await sleep(2)
+    result = ("second", perf_counter()-t0)
+    print(f"second returning: {describe(result)}")
     return result
 
 async def third(second_result):
-    t0 = time.perf_counter()
-    print(f"third: starting with input '{second_result}'; waiting 3s")
-    await asyncio.sleep(3)
-    result = f"third: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"third returning: {result}")
+    t0 = perf_counter()
+    print(f"third: starting with input '{describe(second_result)}'; waiting 3s")
+    await sleep(3)
+    result = ("third", perf_counter()-t0)
+    print(f"third returning: {describe(result)}")
     return result
 
+async def third_batch(second_results):
+    """Runs third() over a batch of inputs concurrently, keeping the input order"""
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(third(r)) for r in second_results]
+    return [t.result() for t in tasks]
+
+QUEUE_MAXSIZE = 8  # max items buffered between stages; a full queue makes producers wait
+SENTINEL = None     # put by the producer when done so the consumer loop can exit
+
 async def main_queue():
     print("\nRunning with Queue...")
-    t0 = time.perf_counter()
-    queue = asyncio.Queue()
+    t0 = perf_counter()
+    # Bounded queue: caps in-flight items when the pattern is scaled to many items
+    queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
 
     async def second_with_queue():
-        """Wraps second() to put its result in the queue"""
+        """Wraps second() to put its result in the queue, then signal the end of the stream"""
         result = await second()
-        await queue.put(result)
+        await queue.put(result)  # Only suspends while the queue is full
+        await queue.put(SENTINEL)
         return result
 
     async def third_with_queue():
-        """Wraps third() to get its input from the queue"""
-        second_result = await queue.get()
-        return await third(second_result)
+        """Wraps third() to process items from the queue until the sentinel arrives.
+
+        Each wake-up drains everything already queued with get_nowait() and hands it
+        to third_batch(), so a burst of results costs one event-loop round-trip
+        instead of one per item.
+        """
+        results = []
+        while True:
+            batch = []
+            item = await queue.get()
+            while item is not SENTINEL:
+                batch.append(item)
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            if batch:
+                results.extend(await third_batch(batch))
+            if item is SENTINEL:
+                return results
 
     async with asyncio.TaskGroup() as tg:
         # Start first() and second() concurrently
@@ -78,14 +125,60 @@ async def main_queue():
         t3 = tg.create_task(third_with_queue())
 
     print(f"Results:")
-    print(f"Task 1: {t1.result()}")
-    print(f"Task 2: {t2.result()}")
-    print(f"Task 3: {t3.result()}")
-    print(f"total elapsed: {time.perf_counter()-t0:.2f}s")
+    print(f"Task 1: {describe(t1.result())}")
+    print(f"Task 2: {describe(t2.result())}")
+    for result in t3.result():
+        print(f"Task 3: {describe(result)}")
+    print(f"total elapsed: {perf_counter()-t0:.2f}s")
+
+POOL_WORKERS = 3  # consumers started by main_queue_pool()
+
+async def main_queue_pool(n_workers=POOL_WORKERS):
+    """Scales the consumer side out: n_workers third() workers share one queue"""
+    print(f"\nRunning with Queue and a pool of {n_workers} workers...")
+    t0 = perf_counter()
+    queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+
+    async def second_with_queue():
+        """Wraps second() to put its result in the queue"""
+        result = await second()
+        await queue.put(result)
+        return result
+
+    async def producers():
+        """Runs one second() per worker, then puts one sentinel per worker to stop the pool"""
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(second_with_queue()) for _ in range(n_workers)]
+        for _ in range(n_workers):
+            await queue.put(SENTINEL)
+        return [t.result() for t in tasks]
+
+    async def third_worker():
+        """Takes items from the shared queue until it receives a sentinel"""
+        results = []
+        while (second_result := await queue.get()) is not SENTINEL:
+            results.append(await third(second_result))
+        return results
+
+    async with asyncio.TaskGroup() as tg:
+        t1 = tg.create_task(first())
+        t2 = tg.create_task(producers())
+        workers = [tg.create_task(third_worker()) for _ in range(n_workers)]
+
+    print(f"Results:")
+    print(f"Task 1: {describe(t1.result())}")
+    for result in t2.result():
+        print(f"Task 2: {describe(result)}")
+    for worker in workers:
+        for result in worker.result():
+            print(f"Task 3: {describe(result)}")
+    print(f"total elapsed: {perf_counter()-t0:.2f}s")
 
 async def main():
     # Run the queue-based implementation
     await main_queue()
+    # Same pattern with several producers and a pool of consumers
+    await main_queue_pool()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
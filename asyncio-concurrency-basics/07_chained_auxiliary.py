@@ -1,14 +1,15 @@
 """
 This example demonstrates an alternative to the queue-based dependency handling
 shown in 06_queue_dependencies.py, using an auxiliary function to chain dependent
-tasks together.
+tasks together (the same technique 05's main_taskgroup() uses).
 
 Key differences from the queue approach:
 1. Simpler implementation - no queue management needed
 2. More explicit dependency chain
 3. BUT less flexible for complex dependency patterns
 4. AND potentially less efficient for certain scenarios:
-   - Can't start third() independently in the TaskGroup
+   - third() is tied to second()'s task, so it can't consume results from other
+     producers or be started and scaled independently of the chain
    - May block other tasks in more complex scenarios
    - Harder to handle dynamic dependencies or fan-out patterns
 
@@ -18,35 +19,44 @@ The main tradeoff is simplicity vs flexibility:
   to decouple the producer (second) from the consumer (third)
 """
 
-import asyncio, time
+import asyncio
+from asyncio import sleep
+from time import perf_counter
+
+from utils.loop import run
+
+def describe(result):
+    """Formats a (name, elapsed) result; done only where it's printed"""
+    name, elapsed = result
+    return f"{name}: finished (total {elapsed:.2f}s)"
 
 async def first():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("first: starting; waiting 5s")
-    await asyncio.sleep(5)
-    result = f"first: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"first returning: {result}")
+    await sleep(5)
+    result = ("first", perf_counter()-t0)
+    print(f"first returning: {describe(result)}")
     return result
 
 async def second():
-    t0 = time.perf_counter()
+    t0 = perf_counter()
     print("second: starting; waiting 2s")
-    await asyncio.sleep(2)
-    result = f"second: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"second returning: {result}")
+    await sleep(2)
+    result = ("second", perf_counter()-t0)
+    print(f"second returning: {describe(result)}")
     return result
 
 async def third(second_result):
-    t0 = time.perf_counter()
-    print(f"third: starting with input '{second_result}'; waiting 3s")
-    await asyncio.sleep(3)
-    result = f"third: finished (total {time.perf_counter()-t0:.2f}s)"
-    print(f"third returning: {result}")
+    t0 = perf_counter()
+    print(f"third: starting with input '{describe(second_result)}'; waiting 3s")
+    await sleep(3)
+    result = ("third", perf_counter()-t0)
+    print(f"third returning: {describe(result)}")
     return result
 
 async def main_auxiliary():
     print("\nRunning with auxiliary function...")
-    t0 = time.perf_counter()
+    t0 = perf_counter()
 
     async def second_and_third():
         """Chains second() and third() together"""
@@ -63,14 +73,14 @@ async def main_auxiliary():
     second_result, third_result = t23.result()
     
     print(f"Results:")
-    print(f"Task 1: {t1.result()}")
-    print(f"Task 2: {second_result}")
-    print(f"Task 3: {third_result}")
-    print(f"total elapsed: {time.perf_counter()-t0:.2f}s")
+    print(f"Task 1: {describe(t1.result())}")
+    print(f"Task 2: {describe(second_result)}")
+    print(f"Task 3: {describe(third_result)}")
+    print(f"total elapsed: {perf_counter()-t0:.2f}s")
 
 async def main():
     # Run the auxiliary function implementation
     await main_auxiliary()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
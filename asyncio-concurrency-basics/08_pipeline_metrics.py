@@ -0,0 +1,85 @@
+"""
+This example instruments a queue-based pipeline to show whether it actually
+overlaps work, using the latency metrics from video-analytics pipelines:
+
+- stage latency: time an item spends inside one stage (exit - enter)
+- e2e (end-to-end) latency: time from an item entering the first stage to it
+  leaving the last one, including any time spent waiting in queues
+- f2f (frame-to-frame) interval: time between two consecutive items leaving the
+  pipeline, i.e. the inverse of its throughput
+
+06_queue_dependencies.py shows that queues let stages overlap but doesn't
+quantify it. Here every stage runs as its own task connected by queues, each
+item/stage pair is timed with utils.timer.Timer, and an outer Timer measures the
+whole run. With stages of 0.2s + 0.5s + 0.3s and 5 items:
+- Without overlap, each item would take 1.0s: ~5s total
+- With the pipeline, stages work on different items at the same time, so once
+  it is full an item leaves every ~0.5s (the slowest stage): ~3s total
+- f2f settles at the slowest stage's latency, while e2e grows for later items
+  because they wait in the queue in front of that stage
+"""
+
+import asyncio
+from asyncio import sleep
+
+from utils.loop import run
+from utils.timer import Timer
+
+N_ITEMS = 5
+STAGES = (("decode", 0.2), ("infer", 0.5), ("encode", 0.3))  # (name, seconds per item)
+SENTINEL = None  # passed down the pipeline after the last item to stop each stage
+
+async def stage(name, delay, inbox, outbox, records):
+    """Processes items from inbox until the sentinel, recording enter/exit timestamps"""
+    while (item := await inbox.get()) is not SENTINEL:
+        with Timer(name=name, auto_print=False) as t:
+            await sleep(delay)  # Simulate the stage's work on this item
+        records[item][name] = (t.start_time, t.end_time)
+        await outbox.put(item)
+    await outbox.put(SENTINEL)
+
+async def sink(inbox, exits):
+    """Collects items leaving the last stage, in the order they leave"""
+    while (item := await inbox.get()) is not SENTINEL:
+        exits.append(item)
+
+def print_metrics(records, exits, t0):
+    """Prints per-item stage, e2e and f2f latencies as a table (times relative to t0)"""
+    names = [name for name, _ in STAGES]
+    first, last = names[0], names[-1]
+    print(f"{'item':>4} | " + " | ".join(f"{n:>7}" for n in names)
+          + f" | {'enter':>7} | {'exit':>7} | {'e2e':>7} | {'f2f':>7}")
+    prev_exit = None
+    for item in exits:
+        stages = records[item]
+        enter, exit_ = stages[first][0], stages[last][1]
+        f2f = f"{exit_ - prev_exit:6.3f}s" if prev_exit is not None else f"{'-':>7}"
+        prev_exit = exit_
+        print(f"{item:>4} | "
+              + " | ".join(f"{stages[n][1] - stages[n][0]:6.3f}s" for n in names)
+              + f" | {enter - t0:6.3f}s | {exit_ - t0:6.3f}s | {exit_ - enter:6.3f}s | {f2f}")
+
+async def main_pipeline():
+    print("\nRunning a 3-stage pipeline...")
+    records = [{} for _ in range(N_ITEMS)]
+    exits = []
+    queues = [asyncio.Queue() for _ in range(len(STAGES) + 1)]
+
+    with Timer(name="total elapsed") as total:
+        for item in range(N_ITEMS):
+            queues[0].put_nowait(item)
+        queues[0].put_nowait(SENTINEL)
+        async with asyncio.TaskGroup() as tg:
+            for (name, delay), inbox, outbox in zip(STAGES, queues, queues[1:]):
+                tg.create_task(stage(name, delay, inbox, outbox, records))
+            tg.create_task(sink(queues[-1], exits))
+
+    print_metrics(records, exits, total.start_time)
+    sequential = N_ITEMS * sum(delay for _, delay in STAGES)
+    print(f"sum of stage latencies (no overlap): {sequential:.3f}s")
+
+async def main():
+    await main_pipeline()
+
+if __name__ == "__main__":
+    run(main())
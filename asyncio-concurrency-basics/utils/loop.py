@@ -0,0 +1,23 @@
+import asyncio
+from typing import Any, Coroutine
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run `main` like `asyncio.run`, on a uvloop event loop when uvloop is installed.
+
+    The loop is picked per run through `asyncio.Runner`'s `loop_factory` (Python 3.11+)
+    rather than by installing a process-wide event loop policy, since the policy system
+    is deprecated from Python 3.14.
+
+    Args:
+        main: The coroutine to run.
+
+    Returns:
+        Whatever `main` returns.
+    """
+    try:
+        import uvloop  # optional: libuv-based event loop, faster than the default one
+    except ImportError:
+        # not installed (or Windows): fall back to the stock asyncio loop
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
@@ -1,10 +1,24 @@
 import time
 import asyncio
-from typing import Optional, Union, Any, AsyncGenerator
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Optional, Union, Any, Callable, Awaitable
 
-class Timer(AbstractAsyncContextManager):
-    """A flexible async timer context manager with customizable formatting options.
+DEFAULT_FORMAT = "{name}: {seconds:.3f}s"
+
+def _compile_format(format: str) -> Callable[[str, float, float], str]:
+    """Return a renderer for `format`, using an f-string fast path for the default template."""
+    if format == DEFAULT_FORMAT:
+        return lambda name, seconds, milliseconds: f"{name}: {seconds:.3f}s"
+    render = format.format_map
+    return lambda name, seconds, milliseconds: render(
+        {"name": name, "seconds": seconds, "milliseconds": milliseconds}
+    )
+
+class Timer:
+    """A flexible timer context manager with customizable formatting options.
+    
+    Use it with a plain ``with``, which works inside coroutines too and avoids the
+    extra coroutine round-trips of ``async with``; the async form is kept for
+    backward compatibility and delegates to the sync one, then awaits ``on_exit``.
     
     Args:
         name (str, optional): Name to identify this timer. Defaults to "Timer".
@@ -15,133 +29,160 @@ class Timer(AbstractAsyncContextManager):
             Defaults to "{name}: {seconds:.3f}s"
         unit (str, optional): Time unit to return. Either "s" or "ms". Defaults to "s".
         auto_print (bool, optional): Whether to print timing automatically. Defaults to True.
+        on_exit (callable, optional): Async hook awaited with the timer at the end of an
+            ``async with`` block, after the timing is taken (e.g. to flush it to an async
+            log). A plain ``with`` never awaits, so it ignores the hook. Defaults to None.
     
     Example:
         >>> # Basic usage with automatic printing
-        >>> async with Timer(name="Task"):
+        >>> with Timer(name="Task"):
         ...     await asyncio.sleep(1)  # Some async work here
         Task: 1.001s
         
         >>> # Custom format and manual timing access
-        >>> async with Timer(name="Processing", auto_print=False) as timer:
+        >>> with Timer(name="Processing", auto_print=False) as timer:
         ...     await asyncio.sleep(0.5)  # Some async work here
         ...     elapsed = timer.elapsed  # Get elapsed time
         >>> print(f"Took {elapsed:.2f} seconds")
         Took 0.50 seconds
         
-        >>> # Using milliseconds
+        >>> # Using milliseconds, with the backward compatible async form
         >>> async with Timer(name="Quick task", unit="ms"):
         ...     await asyncio.sleep(0.1)  # Some async work here
         Quick task: 100.234ms
+        
+        >>> # Hand the result to an async sink when the block ends
+        >>> async with Timer(name="Flushed", auto_print=False, on_exit=log_timing):
+        ...     await asyncio.sleep(0.1)  # log_timing(timer) is awaited after this
+    
+    Note:
+        Timer defines ``__slots__`` so instances carry no ``__dict__``. It doesn't
+        subclass ``AbstractContextManager``/``AbstractAsyncContextManager`` (those
+        bases have no ``__slots__`` and would add the ``__dict__`` back), but still
+        passes ``isinstance`` checks against both, since those are structural.
     """
     
+    __slots__ = ("name", "format", "unit", "auto_print",
+                 "on_exit", "_start_time", "_end_time", "_perf", "_render", "_is_ms")
+    
     def __init__(
         self,
         name: str = "Timer",
-        format: str = "{name}: {seconds:.3f}s",
+        format: str = DEFAULT_FORMAT,
         unit: str = "s",
-        auto_print: bool = True
+        auto_print: bool = True,
+        on_exit: Optional[Callable[["Timer"], Awaitable[None]]] = None
     ):
         self.name = name
         self.format = format
         self.unit = unit.lower()
         self.auto_print = auto_print
+        self.on_exit = on_exit
         
         if self.unit not in ("s", "ms"):
             raise ValueError("Unit must be either 's' or 'ms'")
         
         self._start_time: Optional[float] = None
         self._end_time: Optional[float] = None
+        self._perf = time.perf_counter  # bound once instead of looked up per call
+        self._render = _compile_format(format)
+        self._is_ms = self.unit == "ms"
     
-    async def __aenter__(self) -> "Timer":
-        self._start_time = time.perf_counter()
+    def __enter__(self) -> "Timer":
+        self._start_time = self._perf()
         return self
     
-    async def __aexit__(self, exc_type: Optional[type], exc_val: Optional[Exception], 
-                        exc_tb: Optional[Any]) -> None:
-        self._end_time = time.perf_counter()
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], 
+                 exc_tb: Optional[Any]) -> None:
+        self._end_time = self._perf()
         if self.auto_print:
             print(str(self))
     
+    async def __aenter__(self) -> "Timer":
+        return self.__enter__()
+    
+    async def __aexit__(self, exc_type: Optional[type], exc_val: Optional[Exception], 
+                        exc_tb: Optional[Any]) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+        if self.on_exit is not None:
+            await self.on_exit(self)
+    
     @property
     def elapsed(self) -> float:
         """Get the elapsed time in the configured unit (seconds or milliseconds)."""
+        seconds = self._seconds()
+        return seconds * 1000 if self._is_ms else seconds
+    
+    @property
+    def start_time(self) -> Optional[float]:
+        """The `time.perf_counter()` reading when the timer was entered, if it has been."""
+        return self._start_time
+    
+    @property
+    def end_time(self) -> Optional[float]:
+        """The `time.perf_counter()` reading when the timer exited, if it has."""
+        return self._end_time
+    
+    def _seconds(self) -> float:
+        """Raw elapsed seconds, whatever the configured unit."""
         if self._start_time is None:
             raise RuntimeError("Timer hasn't been started")
         
-        end_time = self._end_time if self._end_time is not None else time.perf_counter()
-        seconds = end_time - self._start_time
-        
-        return seconds * 1000 if self.unit == "ms" else seconds
+        end_time = self._end_time if self._end_time is not None else self._perf()
+        return end_time - self._start_time
     
     def __str__(self) -> str:
         """Return the formatted timing string."""
-        elapsed = self.elapsed
-        seconds = elapsed / 1000 if self.unit == "ms" else elapsed
-        milliseconds = elapsed if self.unit == "ms" else elapsed * 1000
-        
-        return self.format.format(
-            name=self.name,
-            seconds=seconds,
-            milliseconds=milliseconds
-        )
+        seconds = self._seconds()
+        return self._render(self.name, seconds, seconds * 1000.0)
 
-@asynccontextmanager
-async def timer(name: str = "Timer", format: str = "{name}: {seconds:.3f}s", unit: str = "s", auto_print: bool = True) -> AsyncGenerator[dict, None]:
-    """A simpler timer implementation using the asynccontextmanager decorator.
-    
-    Args:
-        name (str, optional): Name to identify this timer. Defaults to "Timer".
-        format (str, optional): Custom format string. Same variables as Timer class.
-            Defaults to "{name}: {seconds:.3f}s"
-        unit (str, optional): Time unit to return. Either "s" or "ms". Defaults to "s".
-        auto_print (bool, optional): Whether to print timing automatically. Defaults to True.
-    
-    Example:
-        >>> async with timer(name="Quick task"):
-        ...     await asyncio.sleep(1)
-        Quick task: 1.001s
-    """
-    if unit not in ("s", "ms"):
-        raise ValueError("Unit must be either 's' or 'ms'")
-        
-    start = time.perf_counter()
-    try:
-        yield {"name": name, "format": format, "unit": unit}
-    finally:
-        elapsed = time.perf_counter() - start
-        if unit == "ms":
-            elapsed *= 1000
-        if auto_print:
-            print(format.format(
-                name=name,
-                seconds=elapsed/1000 if unit == "ms" else elapsed,
-                milliseconds=elapsed if unit == "ms" else elapsed*1000
-            ))
+# Deprecated: `timer` used to be a separate @asynccontextmanager implementation; it's
+# now an alias of the (cheaper) Timer class and accepts the same keyword arguments.
+timer = Timer
+
+async def _timed_sleep(t: Timer, delay: float) -> Timer:
+    """Time an `asyncio.sleep(delay)` with `t` and return the timer for reporting."""
+    with t:
+        await asyncio.sleep(delay)  # Simulate some async work
+    return t
+
+async def _async_timed_sleep(t: Timer, delay: float) -> Timer:
+    """Same as `_timed_sleep`, using the `async with` form."""
+    async with t:
+        await asyncio.sleep(delay)  # Simulate some async work
+    return t
 
 async def example():
+    # The demos within each section are independent, so they run concurrently;
+    # printing waits for the group so the output order stays fixed
     print("\nClass-based Timer:")
-    # Basic usage with class
-    async with Timer(name="Basic Example"):
-        await asyncio.sleep(1)  # Simulate some async work
-    
-    # Custom format with milliseconds using class
-    async with Timer(name="Custom Format", format="{name} took {milliseconds:.2f}ms", unit="ms"):
-        await asyncio.sleep(0.5)  # Simulate some async work
-    
-    # Manual timing access with class
-    async with Timer(name="Manual Timer", auto_print=False) as t:
-        await asyncio.sleep(0.75)  # Simulate some async work
-        print(f"Custom message: {t.elapsed:.2f}s")
-    
-    print("\nDecorator-based timer:")
-    # Basic usage with decorator
-    async with timer(name="Basic Example"):
-        await asyncio.sleep(1)  # Simulate some async work
-    
-    # Custom format with milliseconds using decorator
-    async with timer(name="Custom Format", format="{name} took {milliseconds:.2f}ms", unit="ms"):
-        await asyncio.sleep(0.5)  # Simulate some async work
+    async with asyncio.TaskGroup() as tg:
+        # Basic usage with class
+        basic = tg.create_task(_timed_sleep(
+            Timer(name="Basic Example", auto_print=False), 1))
+        # Custom format with milliseconds using class
+        custom = tg.create_task(_timed_sleep(
+            Timer(name="Custom Format", format="{name} took {milliseconds:.2f}ms", unit="ms",
+                  auto_print=False), 0.5))
+        # Manual timing access with class
+        manual = tg.create_task(_timed_sleep(
+            Timer(name="Manual Timer", auto_print=False), 0.75))
+    print(basic.result())
+    print(custom.result())
+    print(f"Custom message: {manual.result().elapsed:.2f}s")
+    
+    print("\nFunction-style timer (alias of Timer):")
+    async with asyncio.TaskGroup() as tg:
+        # Basic usage with the alias
+        basic = tg.create_task(_async_timed_sleep(
+            timer(name="Basic Example", auto_print=False), 1))
+        # Custom format with milliseconds using the alias
+        custom = tg.create_task(_async_timed_sleep(
+            timer(name="Custom Format", format="{name} took {milliseconds:.2f}ms", unit="ms",
+                  auto_print=False), 0.5))
+    print(basic.result())
+    print(custom.result())
 
 if __name__ == "__main__":
-    asyncio.run(example())
+    from loop import run  # utils/ is on sys.path when this file is run as a script
+    run(example())
@@ -1,10 +1,21 @@
 """
 Method override example demonstrating how to properly override methods
-and use super() to extend parent class functionality.
+and use super() to extend parent class functionality, plus binding a parent
+method once in the class body for methods called in hot loops, and a
+column-wise EmployeeTable that applies the overridden rules in bulk.
 """
 
+from array import array
+from typing import Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # Optional: EmployeeTable falls back to a pure-Python loop
+    np = None
+
 class Employee:
     """Base class for all employees."""
+    __slots__ = ('name', 'id', 'base_salary')
     
     def __init__(self, name: str, id: str, base_salary: float):
         self.name = name
@@ -17,12 +28,21 @@ class Employee:
 
     def get_info(self) -> str:
         """Get employee information."""
+        # Adjacent f-strings are merged at compile time into a single string
+        # build, so no intermediate strings are created (no "\n".join needed)
         return (f"Employee ID: {self.id}\n"
                 f"Name: {self.name}\n"
                 f"Base Salary: ${self.base_salary:,.2f}")
 
 class Manager(Employee):
     """Manager class with additional bonus calculation."""
+    __slots__ = ('team_size',)  # Only the new attribute; the rest come from Employee
+    _BONUS_PER_REPORT = 1000
+    # Parent implementations bound once at class creation. Same result as super()
+    # for this single-inheritance hierarchy, minus the per-call super() proxy
+    # (use super() instead when the class takes part in cooperative multiple inheritance)
+    _parent_calculate_salary = Employee.calculate_salary
+    _parent_get_info = Employee.get_info
     
     def __init__(self, name: str, id: str, base_salary: float, team_size: int):
         # Call parent's __init__ first
@@ -32,12 +52,12 @@ class Manager(Employee):
     def calculate_salary(self) -> float:
         """
         Override salary calculation to include management bonus.
-        Demonstrates extending parent method using super().
+        Demonstrates extending the parent method (bound in the class body).
         """
         # Get base salary from parent class
-        base_salary = super().calculate_salary()
+        base_salary = Manager._parent_calculate_salary(self)
         # Add management bonus based on team size
-        management_bonus = self.team_size * 1000
+        management_bonus = self.team_size * Manager._BONUS_PER_REPORT
         return base_salary + management_bonus
 
     def get_info(self) -> str:
@@ -46,7 +66,7 @@ class Manager(Employee):
         Demonstrates how to extend parent's method output.
         """
         # Get basic info from parent class
-        basic_info = super().get_info()
+        basic_info = Manager._parent_get_info(self)
         # Add manager-specific information
         return (f"{basic_info}\n"
                 f"Team Size: {self.team_size}\n"
@@ -54,6 +74,8 @@ class Manager(Employee):
 
 class Developer(Employee):
     """Developer class with different bonus structure."""
+    __slots__ = ('programming_languages',)
+    _BONUS_PER_LANGUAGE = 1500
     
     def __init__(self, name: str, id: str, base_salary: float, 
                  programming_languages: list[str]):
@@ -66,7 +88,7 @@ class Developer(Employee):
         Demonstrates completely replacing parent method.
         """
         # Developer salary includes language expertise bonus
-        language_bonus = len(self.programming_languages) * 1500
+        language_bonus = len(self.programming_languages) * Developer._BONUS_PER_LANGUAGE
         return self.base_salary + language_bonus
 
     def get_info(self) -> str:
@@ -80,6 +102,59 @@ class Developer(Employee):
                 f"Base Salary: ${self.base_salary:,.2f}\n"
                 f"Role: Developer")
 
+class EmployeeTable:
+    """
+    Stores many employees column-wise (one array per attribute) instead of one
+    object each. Demonstrates the data-oriented alternative to calling the
+    overridden calculate_salary() per object: the same rules, applied per column
+    with NumPy when it's installed.
+    """
+    EMPLOYEE, MANAGER, DEVELOPER = 0, 1, 2
+    # Exact types only: a further subclass could override calculate_salary() again
+    _ROLES = {Employee: EMPLOYEE, Manager: MANAGER, Developer: DEVELOPER}
+
+    def __init__(self, employees: Iterable[Employee] = ()):
+        self.base_salary = array('d')
+        self.team_size = array('q')
+        self.n_languages = array('q')
+        self.role = array('B')
+        for employee in employees:
+            self.append(employee)
+
+    def __len__(self) -> int:
+        return len(self.role)
+
+    def append(self, employee: Employee) -> None:
+        """Add one employee as a new row."""
+        role = self._ROLES.get(type(employee))
+        if role is None:
+            raise TypeError(f"Unsupported employee type: {type(employee).__name__}")
+        self.base_salary.append(employee.base_salary)
+        self.team_size.append(employee.team_size if role == self.MANAGER else 0)
+        self.n_languages.append(
+            len(employee.programming_languages) if role == self.DEVELOPER else 0)
+        self.role.append(role)
+
+    def calculate_salaries(self) -> List[float]:
+        """Calculate every row's salary, matching each class's calculate_salary()."""
+        manager_bonus = Manager._BONUS_PER_REPORT
+        language_bonus = Developer._BONUS_PER_LANGUAGE
+        MANAGER, DEVELOPER = self.MANAGER, self.DEVELOPER
+        if np is None:
+            return [base
+                    + (team * manager_bonus if role == MANAGER else 0)
+                    + (langs * language_bonus if role == DEVELOPER else 0)
+                    for base, team, langs, role in zip(self.base_salary, self.team_size,
+                                                       self.n_languages, self.role)]
+        # Zero-copy views over the arrays; each bonus only applies to its own role
+        base = np.frombuffer(self.base_salary, dtype=np.float64)
+        team = np.frombuffer(self.team_size, dtype=np.int64)
+        langs = np.frombuffer(self.n_languages, dtype=np.int64)
+        role = np.frombuffer(self.role, dtype=np.uint8)
+        return (base
+                + np.where(role == MANAGER, team * manager_bonus, 0)
+                + np.where(role == DEVELOPER, langs * language_bonus, 0)).tolist()
+
 def main():
     # Create instances of different employee types
     manager = Manager(
@@ -110,6 +185,13 @@ def main():
     print(f"Manager's Total Salary: ${manager.calculate_salary():,.2f}")
     print(f"Developer's Total Salary: ${developer.calculate_salary():,.2f}")
 
+    # Same rules applied column-wise to many employees at once
+    print("\nBatch Salary Calculation:")
+    print("-" * 50)
+    table = EmployeeTable([manager, developer, Employee("Carol White", "E789", 50000)])
+    print(f"Salaries for {len(table)} employees: "
+          f"{', '.join(f'${salary:,.2f}' for salary in table.calculate_salaries())}")
+
     # Demonstrate isinstance() with inheritance
     print("\nInheritance Checks:")
     print("-" * 50)
@@ -1,40 +1,61 @@
 """
-Abstract base class example demonstrating how to define and use abstract classes
-and methods to enforce interfaces in Python.
+Abstract base class example demonstrating how to define abstract classes
+and enforce interfaces in Python, here without the abc module: the check
+runs once in __init_subclass__ when a concrete class is defined.
 """
 
-from abc import ABC, abstractmethod
 from typing import List
 
-class DataSource(ABC):
+class DataSource:
     """
     Abstract base class defining a common interface for data sources.
-    ABC ensures this class cannot be instantiated directly.
+    Subclasses must override every method named in _required when they are
+    defined, unless they are declared as intermediate abstract bases with
+    `class X(DataSource, abstract=True)`. Abstract classes, this one included,
+    cannot be instantiated directly.
     """
-    
-    @abstractmethod
+    _required = ('connect', 'disconnect', 'fetch_data')
+    _abstract = True
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs):
+        """Reject concrete subclasses that leave a required method unimplemented."""
+        super().__init_subclass__(**kwargs)
+        cls._abstract = abstract
+        if abstract:
+            return
+        missing = [
+            name for name in cls._required
+            if getattr(cls, name, None) is getattr(DataSource, name)
+            or not callable(getattr(cls, name, None))
+        ]
+        if missing:
+            raise TypeError(f"{cls.__name__} must implement: {', '.join(missing)}")
+
+    def __new__(cls, *args, **kwargs):
+        if cls._abstract:
+            raise TypeError(f"Can't instantiate abstract class {cls.__name__} directly")
+        return super().__new__(cls)
+
     def connect(self) -> bool:
         """
         Establish connection to the data source.
         Must be implemented by concrete classes.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def disconnect(self) -> bool:
         """
         Close connection to the data source.
         Must be implemented by concrete classes.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def fetch_data(self) -> List[dict]:
         """
         Retrieve data from the source.
         Must be implemented by concrete classes.
         """
-        pass
+        raise NotImplementedError
 
     def get_status(self) -> str:
         """
@@ -126,6 +147,40 @@ def main():
     except TypeError as e:
         print(f"Error: {e}")
 
+    # Demonstrate that an incomplete subclass is rejected when it is defined
+    print("\nDefining a subclass without fetch_data:")
+    print("-" * 50)
+    try:
+        class IncompleteSource(DataSource):
+            def connect(self) -> bool:
+                return True
+
+            def disconnect(self) -> bool:
+                return True
+    except TypeError as e:
+        print(f"Error: {e}")
+
+    # Intermediate bases opt out of the check and are completed by their subclasses
+    print("\nDefining an intermediate abstract base:")
+    print("-" * 50)
+
+    class FileSource(DataSource, abstract=True):
+        def connect(self) -> bool:
+            return True
+
+        def disconnect(self) -> bool:
+            return True
+
+    class CSVSource(FileSource):
+        def fetch_data(self) -> List[dict]:
+            return [{"id": 1, "row": "a,b,c"}]
+
+    try:
+        FileSource()
+    except TypeError as e:
+        print(f"Error: {e}")
+    print(f"CSVSource data: {CSVSource().fetch_data()}")
+
     # Show how concrete implementations work
     print("\nUsing DatabaseSource:")
     print("-" * 50)
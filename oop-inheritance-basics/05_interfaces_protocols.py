@@ -1,54 +1,120 @@
 """
 Interface and Protocol example demonstrating Python's structural subtyping
-approach using the typing.Protocol class (Python 3.8+).
+approach. The interfaces are ABCs with a __subclasshook__ (the mechanism behind
+collections.abc, e.g. Sized or Iterable): like a typing.Protocol with
+@runtime_checkable, any class providing the methods passes isinstance() without
+inheriting from them, but the result is cached per class by ABCMeta instead of
+re-inspecting the protocol members on every check.
 """
 
-from typing import Protocol, List, runtime_checkable
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List, Tuple, Iterator, Deque
 from datetime import datetime
 
-@runtime_checkable
-class Loggable(Protocol):
+def _has_methods(C: type, *methods: str) -> bool:
+    """Check that every method is defined somewhere in C's MRO (and not set to None)."""
+    mro = C.__mro__
+    for method in methods:
+        for B in mro:
+            if method in B.__dict__:
+                if B.__dict__[method] is None:
+                    return False
+                break
+        else:
+            return False
+    return True
+
+class Loggable(ABC):
     """
-    Protocol defining an interface for objects that can be logged.
-    The @runtime_checkable decorator allows isinstance() checks.
+    Interface for objects that can be logged.
+    __subclasshook__ makes any class with these methods count as Loggable, so
+    isinstance() checks work without explicit inheritance.
     """
+    __slots__ = ()
+
+    @abstractmethod
     def log_entry(self, message: str) -> None:
         """Log a message."""
         ...
 
+    @abstractmethod
     def get_log_history(self) -> List[str]:
         """Retrieve log history."""
         ...
 
-@runtime_checkable
-class Exportable(Protocol):
-    """Protocol defining an interface for objects that can be exported."""
+    @abstractmethod
+    def iter_log_history(self) -> Iterator[str]:
+        """Iterate over the log history without building a list."""
+        ...
+
+    @classmethod
+    def __subclasshook__(cls, C: type):
+        if cls is Loggable:
+            return _has_methods(C, 'log_entry', 'get_log_history', 'iter_log_history')
+        return NotImplemented
+
+class Exportable(ABC):
+    """Interface for objects that can be exported, checked structurally like Loggable."""
+    __slots__ = ()
+
+    @abstractmethod
     def export_data(self) -> dict:
         """Export object data."""
         ...
 
+    @classmethod
+    def __subclasshook__(cls, C: type):
+        if cls is Exportable:
+            return _has_methods(C, 'export_data')
+        return NotImplemented
+
 class LogMixin:
     """
-    A mixin class that implements the Loggable protocol.
+    A mixin class that implements the Loggable interface.
     This can be inherited by classes that need logging functionality.
+    Entries are stored as raw (timestamp in ns, message) pairs and only
+    formatted when the history is read; only the latest MAX_LOG_HISTORY are kept.
     """
+    __slots__ = ('_log_history',)
+    MAX_LOG_HISTORY = 10_000
+
     def __init__(self):
-        self._log_history: List[str] = []
+        self._log_history: Deque[Tuple[int, str]] = deque(maxlen=self.MAX_LOG_HISTORY)
 
     def log_entry(self, message: str) -> None:
         """Implement the log_entry method required by Loggable."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._log_history.append(f"[{timestamp}] {message}")
+        self._log_history.append((time.time_ns(), message))
+
+    @staticmethod
+    def _format_entry(timestamp_ns: int, message: str) -> str:
+        """Format a stored entry as '[YYYY-mm-dd HH:MM:SS] message'."""
+        timestamp = datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(sep=" ", timespec="seconds")
+        return f"[{timestamp}] {message}"
 
     def get_log_history(self) -> List[str]:
-        """Implement the get_log_history method required by Loggable."""
-        return self._log_history.copy()
+        """
+        Implement the get_log_history method required by Loggable.
+        Builds a new list; read-only consumers should use iter_log_history().
+        """
+        return list(self.iter_log_history())
+
+    def iter_log_history(self) -> Iterator[str]:
+        """Implement the iter_log_history method required by Loggable."""
+        for timestamp_ns, message in self._log_history:
+            yield self._format_entry(timestamp_ns, message)
+
+# Optional with a __subclasshook__, but registering up front documents the intent
+Loggable.register(LogMixin)
 
 class User(LogMixin):
     """
     User class that implements both Loggable (via LogMixin) and Exportable protocols.
     Note: No explicit inheritance or interface declaration needed for Exportable.
     """
+    __slots__ = ('user_id', 'name')
+
     def __init__(self, user_id: str, name: str):
         super().__init__()  # Initialize LogMixin
         self.user_id = user_id
@@ -68,6 +134,8 @@ class Task:
     Task class that implements Exportable protocol without any inheritance.
     Demonstrates structural subtyping - it only needs to implement the required methods.
     """
+    __slots__ = ('task_id', 'description', 'completed')
+
     def __init__(self, task_id: str, description: str):
         self.task_id = task_id
         self.description = description
@@ -88,7 +156,7 @@ def process_logs(loggable: Loggable) -> None:
     """
     loggable.log_entry("Processing started")
     print("Log History:")
-    for entry in loggable.get_log_history():
+    for entry in loggable.iter_log_history():  # Streams entries, no list copy
         print(f"  {entry}")
 
 def export_item(item: Exportable) -> None:
@@ -3,47 +3,126 @@ Mixin pattern example demonstrating how to use mixins for modular functionality
 that can be combined with various classes.
 """
 
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple, Callable, Sequence, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # Optional: User.validate_batch falls back to a pure-Python loop
+    np = None
 
 class TimestampMixin:
-    """Mixin that adds creation and modification time tracking."""
+    """
+    Mixin that adds creation and modification time tracking.
+    Uses _created_at and _modified_at, which classes using it declare in their
+    __slots__ (mixins keep empty __slots__ so they can be combined freely).
+    Timestamps are stored as ns since the epoch and only turned into datetime
+    objects by get_timestamps(), as naive local times like datetime.now() gives
+    (no tzinfo is kept).
+    """
+    __slots__ = ()
+    _now_cache: Tuple[int, int] = (-1, 0)  # (bucket, ns since the epoch)
     
-    def __init__(self):
-        self._created_at = datetime.now()
-        self._modified_at: Optional[datetime] = None
+    def __init__(self, created_at_ns: Optional[int] = None):
+        # Pass created_at_ns (e.g. from bulk_now()) to share one timestamp across a bulk import
+        self._created_at = time.time_ns() if created_at_ns is None else created_at_ns
+        self._modified_at: Optional[int] = None
+
+    @classmethod
+    def bulk_now(cls) -> int:
+        """
+        Return time.time_ns(), reusing the same value for calls within ~1ms of
+        each other (2**20 ns buckets), so bulk-created objects share one clock read.
+        """
+        bucket = time.monotonic_ns() >> 20
+        cached_bucket, now = TimestampMixin._now_cache
+        if cached_bucket != bucket:
+            now = time.time_ns()
+            TimestampMixin._now_cache = (bucket, now)
+        return now
 
     def update_timestamp(self) -> None:
         """Update the modification timestamp."""
-        self._modified_at = datetime.now()
+        self._modified_at = time.time_ns()
 
-    def get_timestamps(self) -> Dict[str, datetime]:
+    def get_timestamps(self) -> Dict[str, Optional[datetime]]:
         """Get the creation and modification timestamps."""
+        modified_at = self._modified_at
         return {
-            "created_at": self._created_at,
-            "modified_at": self._modified_at
+            "created_at": datetime.fromtimestamp(self._created_at / 1e9),
+            "modified_at": (datetime.fromtimestamp(modified_at / 1e9)
+                            if modified_at is not None else None)
         }
 
 class SerializableMixin:
-    """Mixin that adds JSON serialization capabilities."""
+    """
+    Mixin that adds JSON serialization capabilities.
+    Serializes the public (non-underscore) __slots__ fields of the class, plus
+    the public entries of the instance __dict__ if some class in the MRO has one.
+    """
+    __slots__ = ()
+    _serializable_fields: Tuple[str, ...] = ()
+    _get_fields: Callable[[Any], Tuple[Any, ...]] = staticmethod(lambda obj: ())
+    _has_timestamp = False
+    _uses_dict = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collect the public slot names along the MRO once, when the class is created,
+        together with a getter that reads all of them in a single call.
+        """
+        super().__init_subclass__(**kwargs)
+        fields: List[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if not name.startswith('_') and name not in fields:
+                    fields.append(name)
+        cls._serializable_fields = tuple(fields)
+        # A base without __slots__ gives instances a __dict__ the slot scan can't see
+        cls._uses_dict = cls.__dictoffset__ != 0
+        # Known once the class exists, so from_dict() needs no hasattr() per call
+        cls._has_timestamp = issubclass(cls, TimestampMixin)
+        if len(fields) > 1:
+            cls._get_fields = staticmethod(attrgetter(*fields))
+        elif fields:
+            # attrgetter returns a bare value (not a tuple) for a single name
+            getter = attrgetter(fields[0])
+            cls._get_fields = staticmethod(lambda obj: (getter(obj),))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert object attributes to a dictionary."""
-        return {
-            key: value for key, value in self.__dict__.items()
-            if not key.startswith('_')
-        }
+        data = dict(zip(self._serializable_fields, self._get_fields(self)))
+        if self._uses_dict:
+            data.update((key, value) for key, value in self.__dict__.items()
+                        if not key.startswith('_'))
+        return data
 
     def from_dict(self, data: Dict[str, Any]) -> None:
-        """Update object attributes from a dictionary."""
-        for key, value in data.items():
-            if not key.startswith('_'):
-                setattr(self, key, value)
-        if hasattr(self, 'update_timestamp'):
+        """
+        Update object attributes from a dictionary. Slotted instances ignore unknown
+        keys; instances with a __dict__ take every public key, as to_dict() reads them.
+        """
+        if self._uses_dict:
+            for key, value in data.items():
+                if not key.startswith('_'):
+                    setattr(self, key, value)
+        else:
+            for key in self._serializable_fields:
+                if key in data:
+                    setattr(self, key, data[key])
+        if self._has_timestamp:
             self.update_timestamp()
 
 class ValidationMixin:
-    """Mixin that adds data validation capabilities."""
+    """
+    Mixin that adds data validation capabilities.
+    Uses _errors, which classes using it declare in their __slots__.
+    """
+    __slots__ = ()
     
     def __init__(self):
         self._errors: List[str] = []
@@ -64,17 +143,49 @@ class ValidationMixin:
         return True
 
     def get_validation_errors(self) -> List[str]:
-        """Get the list of validation errors."""
+        """Get the list of validation errors (a copy the caller may modify)."""
         return self._errors.copy()
 
-class User(TimestampMixin, SerializableMixin, ValidationMixin):
+    def iter_validation_errors(self) -> Iterator[str]:
+        """Iterate over the validation errors without copying them (read-only use)."""
+        return iter(self._errors)
+
+def _as_str_array(values: Sequence[Optional[str]]) -> "np.ndarray":
+    """Convert values to a NumPy str array, with None as '' (not the string 'None')."""
+    values = np.asarray(values, dtype=object)
+    values[np.equal(values, None)] = ''
+    return values.astype(str)
+
+@lru_cache(maxsize=None)
+def compose(*mixins: type) -> type:
+    """
+    Build (once per combination) a base class inheriting from the given mixins,
+    with their methods and descriptors copied into its own __dict__. Lookups then
+    stop at the composed class instead of walking every mixin in the MRO;
+    isinstance() checks against each mixin keep working since they are still its
+    bases. Plain data attributes (caches, per-class state) aren't copied, so they
+    still resolve to the one owned by their mixin.
+    """
+    namespace: Dict[str, Any] = {}
+    for mixin in reversed(mixins):  # Earlier mixins win, as in the MRO
+        namespace.update((key, value) for key, value in vars(mixin).items()
+                         if not key.startswith('__') and hasattr(value, '__get__'))
+    namespace['__slots__'] = ()
+    name = f"Composed[{', '.join(mixin.__name__ for mixin in mixins)}]"
+    return type(name, mixins, namespace)
+
+class User(compose(TimestampMixin, SerializableMixin, ValidationMixin)):
     """
     User class that demonstrates combining multiple mixins.
     Shows how mixins can work together to provide modular functionality.
     """
-    def __init__(self, username: str, email: str):
+    # Own fields plus the state of TimestampMixin and ValidationMixin
+    __slots__ = ('username', 'email', '_created_at', '_modified_at', '_errors')
+    MIN_USERNAME_LENGTH = 3
+
+    def __init__(self, username: str, email: str, created_at_ns: Optional[int] = None):
         # Initialize all mixins
-        TimestampMixin.__init__(self)
+        TimestampMixin.__init__(self, created_at_ns)
         ValidationMixin.__init__(self)
         
         self.username = username
@@ -84,8 +195,9 @@ class User(TimestampMixin, SerializableMixin, ValidationMixin):
         """Implement custom validation logic."""
         is_valid = True
         
-        if not self.username or len(self.username) < 3:
-            self._errors.append("Username must be at least 3 characters long")
+        if not self.username or len(self.username) < self.MIN_USERNAME_LENGTH:
+            self._errors.append(
+                f"Username must be at least {self.MIN_USERNAME_LENGTH} characters long")
             is_valid = False
             
         if not self.email or '@' not in self.email:
@@ -94,13 +206,35 @@ class User(TimestampMixin, SerializableMixin, ValidationMixin):
             
         return is_valid
 
-class Article(TimestampMixin, SerializableMixin):
+    @classmethod
+    def validate_batch(cls, usernames: Sequence[str], emails: Sequence[str]) -> List[bool]:
+        """
+        Apply the same rules as _validate() to many (username, email) pairs at once,
+        without creating User objects. Uses NumPy's vectorized string functions
+        when it's installed; only the pass/fail result is returned, not the errors.
+        None counts as an empty (so invalid) value in both paths.
+        """
+        if len(usernames) != len(emails):
+            raise ValueError("usernames and emails must have the same length")
+        if np is None:
+            return [len(username or '') >= cls.MIN_USERNAME_LENGTH and '@' in (email or '')
+                    for username, email in zip(usernames, emails)]
+        usernames = _as_str_array(usernames)
+        emails = _as_str_array(emails)
+        valid = ((np.char.str_len(usernames) >= cls.MIN_USERNAME_LENGTH)
+                 & (np.char.find(emails, '@') >= 0))
+        return valid.tolist()
+
+class Article(compose(TimestampMixin, SerializableMixin)):
     """
     Article class that demonstrates using a subset of available mixins.
     Shows how mixins allow flexible feature composition.
     """
-    def __init__(self, title: str, content: str):
-        TimestampMixin.__init__(self)
+    # Own fields plus the state of TimestampMixin
+    __slots__ = ('title', 'content', '_created_at', '_modified_at')
+
+    def __init__(self, title: str, content: str, created_at_ns: Optional[int] = None):
+        TimestampMixin.__init__(self, created_at_ns)
         self.title = title
         self.content = content
 
@@ -119,16 +253,23 @@ def main():
     # Show validation
     print("Validation result:", user.validate())
     print("Validation errors:", user.get_validation_errors())
+    for error in user.iter_validation_errors():  # Read-only use: no copy needed
+        print("  -", error)
     
     # Show timestamps
     print("Initial timestamps:", {
-        k: v.strftime("%Y-%m-%d %H:%M:%S") if v else None
+        k: v.isoformat(sep=" ", timespec="seconds") if v else None
         for k, v in user.get_timestamps().items()
     })
     
     # Show serialization
     user_data = user.to_dict()
     print("Serialized user:", user_data)
+
+    # Validate many candidate users in one call, without creating objects
+    print("Batch validation:", User.validate_batch(
+        ["jo", "john_doe", "jane", None, "bob"],
+        ["invalid-email", "john@example.com", "jane@example.com", "none@example.com", None]))
     
     # Update user and show timestamp changes
     user.username = "john_doe"
@@ -139,10 +280,16 @@ def main():
     print("Validation result:", user.validate())
     print("Validation errors:", user.get_validation_errors())
     print("Updated timestamps:", {
-        k: v.strftime("%Y-%m-%d %H:%M:%S") if v else None
+        k: v.isoformat(sep=" ", timespec="seconds") if v else None
         for k, v in user.get_timestamps().items()
     })
 
+    # Bulk creation: read the clock once for the whole batch
+    now = TimestampMixin.bulk_now()
+    users = [User(f"user{i}", f"user{i}@example.com", created_at_ns=now) for i in range(3)]
+    print("\nBulk-created users share one creation time:",
+          len({u.get_timestamps()["created_at"] for u in users}) == 1)
+
     # Demonstrate Article with subset of mixins
     print("\nArticle Demo (with timestamp and serializable mixins):")
     print("-" * 50)
@@ -151,7 +298,7 @@ def main():
     
     # Show timestamps
     print("Initial timestamps:", {
-        k: v.strftime("%Y-%m-%d %H:%M:%S") if v else None
+        k: v.isoformat(sep=" ", timespec="seconds") if v else None
         for k, v in article.get_timestamps().items()
     })
     
@@ -160,7 +307,7 @@ def main():
     
     print("\nAfter update:")
     print("Updated timestamps:", {
-        k: v.strftime("%Y-%m-%d %H:%M:%S") if v else None
+        k: v.isoformat(sep=" ", timespec="seconds") if v else None
         for k, v in article.get_timestamps().items()
     })
     
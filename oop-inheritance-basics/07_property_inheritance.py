@@ -3,64 +3,126 @@ Property inheritance example demonstrating how properties and descriptors
 work with inheritance in Python.
 """
 
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Callable
 from datetime import datetime
+from types import MemberDescriptorType
+
+def _slot_setter(owner: Any, slot: str) -> Callable[[Any, Any], None]:
+    """
+    Return a function storing a value under `slot` on owner's instances. If owner
+    declares the slot, that's the __set__ of its member descriptor, which skips the
+    attribute lookup of object.__setattr__; otherwise (e.g. a plain class with a
+    __dict__) it falls back to object.__setattr__.
+    """
+    member = getattr(owner, slot, None)
+    if isinstance(member, MemberDescriptorType):
+        return member.__set__
+    return lambda instance, value: object.__setattr__(instance, slot, value)
 
 class ValidatedProperty:
     """
     A descriptor class that implements validation for a property.
     Demonstrates how descriptors can be used to create reusable property logic.
     """
+    # Fixed field layout (like a C struct): the descriptor's own fields are read
+    # on every get/set of the attribute it manages
+    __slots__ = ('validation_func', 'error_message', 'property_name', '_slot', '_set_slot')
+
     def __init__(self, validation_func, error_message: str):
         self.validation_func = validation_func
         self.error_message = error_message
         self.property_name = ''  # Will be set when the descriptor is assigned to a class
+        self._slot = ''
 
     def __set_name__(self, owner: Any, name: str):
-        """Called when the descriptor is assigned to a class attribute."""
+        """
+        Called when the descriptor is assigned to a class attribute.
+        The value lives in the owner's _v_<name> slot if it declares one (so the owner
+        needs no __dict__), or else in the instance __dict__ under that name.
+        """
         self.property_name = name
+        self._slot = f"_v_{name}"
+        self._set_slot = _slot_setter(owner, self._slot)
 
     def __get__(self, instance: Any, owner: Any) -> Any:
         """Retrieve the property value."""
         if instance is None:
             return self
-        return instance.__dict__.get(self.property_name)
+        return getattr(instance, self._slot, None)
 
     def __set__(self, instance: Any, value: Any):
         """Set and validate the property value."""
         if not self.validation_func(value):
             raise ValueError(f"{self.property_name}: {self.error_message}")
-        instance.__dict__[self.property_name] = value
+        self._set_slot(instance, value)
+
+class IntPositiveProperty(ValidatedProperty):
+    """
+    ValidatedProperty specialized for positive integers.
+    Demonstrates overriding a descriptor method: the check is inlined in __set__
+    instead of calling a validation function on every assignment.
+    """
+    __slots__ = ()
+
+    def __init__(self, error_message: str):
+        super().__init__(None, error_message)  # No validation_func needed
+
+    def __set__(self, instance: Any, value: Any):
+        """Set the value if it's a positive int (exact type, so bools are rejected)."""
+        if type(value) is not int or value <= 0:
+            raise ValueError(f"{self.property_name}: {self.error_message}")
+        self._set_slot(instance, value)
+
+class HttpUrlProperty(ValidatedProperty):
+    """ValidatedProperty specialized for HTTP(S) URLs, with the check inlined in __set__."""
+    __slots__ = ()
+
+    def __init__(self, error_message: str):
+        super().__init__(None, error_message)  # No validation_func needed
+
+    def __set__(self, instance: Any, value: Any):
+        """Set the value if it's a string starting with http:// or https://."""
+        if type(value) is not str or not value.startswith(('http://', 'https://')):
+            raise ValueError(f"{self.property_name}: {self.error_message}")
+        self._set_slot(instance, value)
 
 class TrackingDescriptor:
     """
     A descriptor that tracks when a property was last modified.
     Demonstrates descriptor inheritance and composition.
     """
+    __slots__ = ('property_name', 'tracker_name', '_slot', '_set_slot', '_set_tracker')
+
     def __init__(self):
         self.property_name = ''
         self.tracker_name = ''
+        self._slot = ''
 
     def __set_name__(self, owner: Any, name: str):
         """Called when the descriptor is assigned to a class attribute."""
         self.property_name = name
         self.tracker_name = f"_{name}_last_modified"
+        self._slot = f"_v_{name}"
+        self._set_slot = _slot_setter(owner, self._slot)
+        self._set_tracker = _slot_setter(owner, self.tracker_name)
 
     def __get__(self, instance: Any, owner: Any) -> Any:
         """Retrieve the property value."""
         if instance is None:
             return self
-        return instance.__dict__.get(self.property_name)
+        return getattr(instance, self._slot, None)
 
     def __set__(self, instance: Any, value: Any):
         """Set the value and update the last modified timestamp."""
-        instance.__dict__[self.property_name] = value
-        instance.__dict__[self.tracker_name] = datetime.now()
+        self._set_slot(instance, value)
+        self._set_tracker(instance, datetime.now())
 
 class BaseProduct:
     """
     Base class demonstrating property definition and inheritance.
     """
+    __slots__ = ('_name', '_price')
+
     def __init__(self, name: str, price: float):
         self._name = name
         self._price = price
@@ -91,31 +153,38 @@ class DigitalProduct(BaseProduct):
     """
     Digital product class demonstrating property inheritance and extension.
     """
+    # Storage for the descriptors below (_v_<name>, plus the version tracker);
+    # _price keeps the list price, _price_net the discounted one
+    __slots__ = ('_v_file_size', '_v_download_url', '_v_version',
+                 '_version_last_modified', '_price_net')
+
+    _DISCOUNT = 0.8  # 20% discount for digital products
+
     # Using descriptors for new properties
-    file_size = ValidatedProperty(
-        lambda x: isinstance(x, int) and x > 0,
-        "File size must be a positive integer"
-    )
-    download_url = ValidatedProperty(
-        lambda x: isinstance(x, str) and x.startswith(('http://', 'https://')),
-        "Download URL must be a valid HTTP(S) URL"
-    )
+    file_size = IntPositiveProperty("File size must be a positive integer")
+    download_url = HttpUrlProperty("Download URL must be a valid HTTP(S) URL")
     version = TrackingDescriptor()
 
     def __init__(self, name: str, price: float, file_size: int, download_url: str):
         super().__init__(name, price)
-        self.file_size = file_size  # Uses ValidatedProperty
-        self.download_url = download_url  # Uses ValidatedProperty
+        self._price_net = self._price * self._DISCOUNT
+        self.file_size = file_size  # Uses IntPositiveProperty
+        self.download_url = download_url  # Uses HttpUrlProperty
         self.version = "1.0"  # Uses TrackingDescriptor
 
     @property
     def price(self) -> float:
         """
         Override parent's price property to add digital discount.
-        Demonstrates property override while using parent's validation.
+        The discount is applied when the price is set, so reads do no math.
         """
-        base_price = super().price
-        return base_price * 0.8  # 20% discount for digital products
+        return self._price_net
+
+    @price.setter
+    def price(self, value: float):
+        """Demonstrates property override while using parent's validation."""
+        BaseProduct.price.fset(self, value)  # Parent setter, without a super() proxy
+        self._price_net = self._price * self._DISCOUNT
 
 def main():
     # Demonstrate basic property inheritance
@@ -155,7 +224,7 @@ def main():
         digital.version = "1.1"
         print(f"\nAfter version update:")
         print(f"Version: {digital.version}")
-        print(f"Last modified: {digital.__dict__['_version_last_modified']}")
+        print(f"Last modified: {digital._version_last_modified}")
 
         # Try invalid values
         print("\nTrying invalid values:")